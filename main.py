@@ -9,10 +9,10 @@ Features:
 - Update interval (menu, Alt +/-)
 - CPU total + per-core, RAM, SWAP, Disk, Processes
 """
-import os, sys, time, psutil, platform, shutil, subprocess, socket, tkinter as tk
+import os, sys, time, asyncio, functools, heapq, queue, psutil, platform, shutil, subprocess, socket, threading, tkinter as tk
+from collections import namedtuple
 from tkinter import ttk
 from configparser import ConfigParser
-from datetime import timedelta
 
 # ---------- THEMES ----------
 THEMES = {
@@ -40,20 +40,72 @@ THEMES = {
     }
 }
 FONT_BASE = "JetBrains Mono"
+RESULT_POLL_MS = 10  # Tk polls for asyncio results this often, only while a job is out
+
+# constant for the lifetime of the process
+_HOSTNAME = socket.gethostname()
+_PY_VERSION = platform.python_version()
+
+# on Linux read the hot CPU/RAM counters from /proc ourselves, bypassing psutil
+USE_PROC_FS = sys.platform == "linux"
 
 # ---------- UTILITIES ----------
+_UNITS = ("B", "K", "M", "G", "T", "P")
+
 def bytes2human(n):
-    for u in ["B", "K", "M", "G", "T"]:
-        if n < 1024:
-            return f"{n:.1f}{u}"
-        n /= 1024
-    return f"{n:.1f}P"
+    """Format an int byte count; the unit comes straight from bit_length()."""
+    if n < 1024:
+        return f"{n:.1f}B"
+    e = min((n.bit_length() - 1) // 10, 5)
+    return f"{n / (1 << (e * 10)):.1f}{_UNITS[e]}"
+
+def read_cpu_ticks():
+    """(idle, total) jiffies from /proc/stat: aggregate first, then one per core."""
+    with open("/proc/stat", "rb") as f:
+        data = f.read()
+    ticks = []
+    for line in data.splitlines():
+        if not line.startswith(b"cpu"):
+            break
+        # user nice system idle iowait irq softirq steal (guest* is already in user/nice)
+        v = [int(x) for x in line.split()[1:9]]
+        ticks.append((v[3] + v[4], sum(v)))
+    return ticks
+
+MemInfo = namedtuple("MemInfo", "total used percent")
+
+def read_meminfo():
+    """RAM usage from /proc/meminfo, computed like psutil (used = total - available)."""
+    total = avail = 0
+    with open("/proc/meminfo", "rb") as f:
+        for line in f:
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1]) * 1024
+            elif line.startswith(b"MemAvailable:"):
+                avail = int(line.split()[1]) * 1024
+                break
+    used = total - avail
+    return MemInfo(total, used, used / total * 100 if total else 0.0)
+
+def short_join(parts, limit=100):
+    """Space-join parts, cut to limit chars with a "..." suffix."""
+    out = []
+    total = 0  # len(" ".join(out)) plus the space before the next part
+    for part in parts:
+        if total + len(part) > limit:
+            # copy only what can still be shown of an oversized part
+            out.append(part[:max(0, limit - total)])
+            return " ".join(out)[:limit-3] + "..."
+        out.append(part)
+        total += len(part) + 1
+    return " ".join(out)
 
 def color_for_load(pct, colors):
     if pct < 50: return colors["accent"]
     if pct < 75: return colors["warn"]
     return colors["crit"]
 
+@functools.lru_cache(maxsize=1)
 def get_os_name():
     try:
         out = subprocess.check_output(["lsb_release", "-d"], text=True)
@@ -84,12 +136,15 @@ def get_gpu_list():
                 if ("VGA" in l or "3D controller" in l)]
     except Exception: return []
 
-def format_uptime():
-    boot = psutil.boot_time()
-    delta = timedelta(seconds=int(time.time() - boot))
-    days = delta.days
-    rest = str(delta - timedelta(days=days))
-    return f"{days} day{'s' if days!=1 else ''} {rest}" if days else rest
+def format_uptime(boot):
+    """H:MM:SS (with a day prefix) since `boot`, a psutil.boot_time() value."""
+    s = int(time.time() - boot)
+    d, s = divmod(s, 86400)
+    h, s = divmod(s, 3600)
+    m, s = divmod(s, 60)
+    if d:
+        return f"{d} day{'s' if d!=1 else ''} {h:d}:{m:02d}:{s:02d}"
+    return f"{h:d}:{m:02d}:{s:02d}"
 
 def detect_system_theme():
     """Try detect desktop color-scheme (GNOME first), fallback to dark."""
@@ -114,27 +169,26 @@ def detect_system_theme():
     return "dark"
 
 # ---------- CONFIG ----------
-def cfg_path():
-    base = os.path.join(os.path.expanduser("~"), ".config")
-    os.makedirs(base, exist_ok=True)
-    return os.path.join(base, "sysmon_dark.cfg")
-
-def load_settings():
-    cfg = ConfigParser()
-    cfg.read(cfg_path())
+_CFG_PATH = os.path.join(os.path.expanduser("~"), ".config", "sysmon_dark.cfg")
+
+def load_settings(cfg):
+    """Read the config file into `cfg` (kept by the app for later saves)."""
+    cfg.read(_CFG_PATH)
     fs = cfg.getint("ui", "font_size", fallback=10)
     interval = cfg.getint("ui", "update_interval_ms", fallback=1000)
     theme_mode = cfg.get("ui", "theme_mode", fallback="auto")
-    return fs, interval, theme_mode
+    proc_interval = cfg.getint("ui", "proc_interval_ms", fallback=2000)
+    return fs, interval, theme_mode, proc_interval
 
-def save_settings(fs, interval, theme_mode):
-    cfg = ConfigParser()
+def save_settings(cfg, fs, interval, theme_mode, proc_interval):
     cfg["ui"] = {
         "font_size": str(fs),
         "update_interval_ms": str(interval),
-        "theme_mode": theme_mode
+        "theme_mode": theme_mode,
+        "proc_interval_ms": str(proc_interval)
     }
-    with open(cfg_path(), "w") as f:
+    os.makedirs(os.path.dirname(_CFG_PATH), exist_ok=True)
+    with open(_CFG_PATH, "w") as f:
         cfg.write(f)
 
 # ---------- APP ----------
@@ -145,11 +199,40 @@ class SysMon(tk.Tk):
         self.geometry("1100x770")
         self.minsize(860, 520)
 
-        self.font_size, self.update_interval, self.theme_mode = load_settings()
+        self._cfg = ConfigParser()
+        (self.font_size, self.update_interval, self.theme_mode,
+         self._proc_interval_ms) = load_settings(self._cfg)
+        self._last_proc_update = 0.0
+        self._settings_dirty = False  # something changed since the last save
+        self._prev_cpu_ticks = []  # (idle, total) per read_cpu_ticks() entry
+        self._sampling = False  # a _sample() run is in flight
+        self._after_id = None   # pending _update_all callback
+        self._poll_id = None    # pending _drain_results callback
+        self._static_pending = False  # _load_static_info has not reported back
+        self._results = queue.Queue()  # (fn, args) from the asyncio thread
+        self._closing = False
+        self._system_theme = "dark"  # until detect_system_theme() reports back
         self.colors = THEMES[self._resolve_theme()]
         self.configure(bg=self.colors["bg"])
 
         self._sort_column = ("%CPU", True)
+        # themable widgets by role, filled in by the _create_* methods
+        self._panels = []         # Frames: bg=panel
+        self._labels = []         # Labels/LabelFrames: bg=panel, fg=fg
+        self._canvases = []       # bar canvases (see _create_bar): bg=bg
+        self._status_labels = []  # bg=bg, fg=status
+        self._menus = []          # only need the font
+
+        # static system info never changes while running: query it once.
+        # The subprocess-backed fields are filled in by _load_static_info.
+        self._static_info = {
+            "host": _HOSTNAME,
+            "os": "…",
+            "cpu": "…",
+            "gpus": ["…"],
+            "py": f"Python {_PY_VERSION}",
+            "boot": psutil.boot_time(),
+        }
 
         self._create_menu()
         self._create_top_info()
@@ -159,52 +242,87 @@ class SysMon(tk.Tk):
         self._create_statusbar()
         self._bind_shortcuts()
 
+        # psutil sampling and subprocess calls run on an asyncio loop in a
+        # background thread; results come back to Tk through self._results
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        self._next_tick = time.monotonic()  # deadline of the tick being run
         self._update_all()
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind("<Destroy>", self._on_destroy)
+        self._static_pending = True
+        asyncio.run_coroutine_threadsafe(self._load_static_info(), self._loop)
+        self._start_drain()
+
+    # ---------- STATIC INFO ----------
+    async def _load_static_info(self):
+        """Run the slow lsb_release/lscpu/lspci/gsettings calls concurrently."""
+        results = None
+        try:
+            os_name, cpu, gpus, theme = await asyncio.gather(
+                asyncio.to_thread(get_os_name),
+                asyncio.to_thread(get_cpu_model),
+                asyncio.to_thread(get_gpu_list),
+                asyncio.to_thread(detect_system_theme))
+            results = {"os": os_name, "cpu": cpu, "gpus": gpus, "theme": theme}
+        except Exception as e:
+            print("Static info error:", e, file=sys.stderr)
+        # always report back, so the Tk side stops waiting for this job
+        self._post(self._apply_static_info, results)
+
+    def _apply_static_info(self, results):
+        self._static_pending = False
+        if results is None:
+            return
+        self._system_theme = results.pop("theme")
+        self._static_info.update(results)
+        if self.theme_mode == "auto":
+            self._apply_theme()
+        self._update_top_info()
 
     # ---------- THEME ----------
     def _resolve_theme(self):
         if self.theme_mode == "auto":
-            return detect_system_theme()
+            return self._system_theme
         return self.theme_mode if self.theme_mode in THEMES else "dark"
 
     def _apply_theme(self):
         self.colors = THEMES[self._resolve_theme()]
-        self.configure(bg=self.colors["bg"])
-        for widget in self.winfo_children():
-            self._recolor(widget)
-
-    def _recolor(self, w):
-        try:
-            if isinstance(w, (tk.Frame, tk.LabelFrame)):
-                w.configure(bg=self.colors["panel"], fg=self.colors["fg"])
-            elif isinstance(w, tk.Label):
-                # top labels/status are on panel by design
-                if getattr(w, "_is_status", False):
-                    w.configure(bg=self.colors["bg"], fg=self.colors["status"])
-                else:
-                    w.configure(bg=self.colors["panel"], fg=self.colors["fg"])
-            elif isinstance(w, tk.Canvas):
-                w.configure(bg=self.colors["bg"])
-        except tk.TclError:
-            pass
-        for c in w.winfo_children():
-            self._recolor(c)
+        c = self.colors
+        self.configure(bg=c["bg"])
+        for w in self._panels:
+            w.configure(bg=c["panel"])
+        for w in self._labels:
+            w.configure(bg=c["panel"], fg=c["fg"])
+        for w in self._status_labels:
+            w.configure(bg=c["bg"], fg=c["status"])
+        for w in self._canvases:
+            w.configure(bg=c["bg"])
+            self._style_bar(w)
+        self._style_tree()
 
     # ---------- MENU ----------
     def _create_menu(self):
         m = tk.Menu(self)
         self.config(menu=m)
+        self._menus.append(m)
 
         # Update Interval
         m_interval = tk.Menu(m, tearoff=0)
+        self._menus.append(m_interval)
         for sec in [0.5, 1, 2, 5]:
             m_interval.add_command(label=f"{sec:.1f} sec", command=lambda s=sec: self._set_interval(s))
+        m_interval.add_separator()
+        for sec in [1, 2, 5]:
+            m_interval.add_command(label=f"Process refresh: {sec} sec",
+                                   command=lambda s=sec: self._set_proc_interval(s))
         m.add_cascade(label="Update Interval", menu=m_interval)
 
         # View
         m_view = tk.Menu(m, tearoff=0)
         m_theme = tk.Menu(m_view, tearoff=0)
+        self._menus += [m_view, m_theme]
         for mode in ["auto", "dark", "light"]:
             m_theme.add_command(label=mode.capitalize(), command=lambda md=mode: self._set_theme(md))
         m_view.add_cascade(label="Theme", menu=m_theme)
@@ -216,17 +334,25 @@ class SysMon(tk.Tk):
 
         # Settings
         m_settings = tk.Menu(m, tearoff=0)
+        self._menus.append(m_settings)
         m_settings.add_command(label="Save settings (Ctrl S)", command=self._save_settings_now)
         m.add_cascade(label="Settings", menu=m_settings)
 
     def _set_theme(self, mode):
         self.theme_mode = mode
+        self._settings_dirty = True
         self._apply_theme()
-        self.status.config(text=f"Theme set to {mode} (saved on exit)")
+        self._set_text(self.status, f"Theme set to {mode} (saved on exit)")
 
     def _set_interval(self, sec):
         self.update_interval = int(sec * 1000)
-        self.status.config(text=f"Interval {sec:.1f}s (saved on exit)")
+        self._settings_dirty = True
+        self._set_text(self.status, f"Interval {sec:.1f}s (saved on exit)")
+
+    def _set_proc_interval(self, sec):
+        self._proc_interval_ms = int(sec * 1000)
+        self._settings_dirty = True
+        self._set_text(self.status, f"Process refresh {sec}s (saved on exit)")
 
     # ---------- SHORTCUTS ----------
     def _bind_shortcuts(self):
@@ -246,82 +372,103 @@ class SysMon(tk.Tk):
 
     def _increase_interval(self, e=None):
         self.update_interval = min(self.update_interval + 500, 10000)
-        self.status.config(text=f"Interval: {self.update_interval/1000:.1f}s")
+        self._settings_dirty = True
+        self._set_text(self.status, f"Interval: {self.update_interval/1000:.1f}s")
 
     def _decrease_interval(self, e=None):
         self.update_interval = max(self.update_interval - 500, 250)
-        self.status.config(text=f"Interval: {self.update_interval/1000:.1f}s")
+        self._settings_dirty = True
+        self._set_text(self.status, f"Interval: {self.update_interval/1000:.1f}s")
 
     # ---------- FONT ----------
     def _zoom_in(self, e=None):
         self.font_size += 1
+        self._settings_dirty = True
         self._apply_font_size()
     def _zoom_out(self, e=None):
         if self.font_size > 6:
             self.font_size -= 1
+            self._settings_dirty = True
             self._apply_font_size()
     def _zoom_reset(self, e=None):
         self.font_size = 10
+        self._settings_dirty = True
         self._apply_font_size()
     def _apply_font_size(self):
         ft = (FONT_BASE, self.font_size)
-        for w in self.winfo_children():
-            self._apply_font_recursive(w, ft)
-    def _apply_font_recursive(self, w, ft):
-        try: w.configure(font=ft)
-        except tk.TclError: pass
-        for c in w.winfo_children():
-            self._apply_font_recursive(c, ft)
+        for w in self._labels + self._status_labels + self._menus:
+            w.configure(font=ft)
+        for bar in self._canvases:
+            self._style_bar(bar)
 
     # ---------- SAVE ----------
+    def _save_if_dirty(self):
+        if not self._settings_dirty:
+            return False
+        save_settings(self._cfg, self.font_size, self.update_interval, self.theme_mode, self._proc_interval_ms)
+        self._settings_dirty = False
+        return True
     def _save_settings_now(self, e=None):
-        save_settings(self.font_size, self.update_interval, self.theme_mode)
-        self.status.config(text="Settings saved ✓")
+        saved = self._save_if_dirty()
+        self._set_text(self.status, "Settings saved ✓" if saved else "Settings unchanged ✓")
     def _on_close(self):
-        save_settings(self.font_size, self.update_interval, self.theme_mode)
+        self._save_if_dirty()
+        self._cancel_updates()
         self.destroy()
+    def _on_destroy(self, e):
+        # <Destroy> also fires for every child; only react to the root itself
+        if e.widget is self and not self._closing:
+            self._cancel_updates()
+    def _cancel_updates(self):
+        self._closing = True
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        if self._poll_id:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
 
     # ---------- PANELS ----------
     def _create_top_info(self):
         self.top_frame = tk.Frame(self, bg=self.colors["panel"])
         self.top_frame.pack(fill="x", padx=8, pady=6)
+        self._panels.append(self.top_frame)
         self.top_labels = []
         for _ in range(7):  # Host, Uptime, OS, CPU, GPU1..N, Python
             lbl = tk.Label(self.top_frame, bg=self.colors["panel"], fg=self.colors["fg"], anchor="w")
             lbl.pack(anchor="w", padx=8)
             self.top_labels.append(lbl)
+            self._labels.append(lbl)
         self._update_top_info()
 
-    def _update_top_info(self):
-        host = socket.gethostname()
-        boot = psutil.boot_time()
-        uptime = format_uptime()
-        os_info = get_os_name()
-        cpu_info = get_cpu_model()
-        gpus = get_gpu_list()
-        py = f"Python {platform.python_version()}"
+    def _update_top_info(self, snap=None):
+        info = self._static_info
+        uptime = snap["uptime"] if snap else format_uptime(info["boot"])
 
-        lines = [f"Host: {host}",
+        lines = [f"Host: {info['host']}",
                  f"Uptime: {uptime}",
-                 f"OS: {os_info}",
-                 f"CPU: {cpu_info}"]
-        lines += [f"GPU{i+1}: {g}" for i, g in enumerate(gpus)] or ["GPU: (none detected)"]
-        lines.append(py)
+                 f"OS: {info['os']}",
+                 f"CPU: {info['cpu']}"]
+        lines += [f"GPU{i+1}: {g}" for i, g in enumerate(info["gpus"])] or ["GPU: (none detected)"]
+        lines.append(info["py"])
 
         # Ensure label list long enough
         for i in range(max(len(self.top_labels), len(lines)) - len(self.top_labels)):
             lbl = tk.Label(self.top_frame, bg=self.colors["panel"], fg=self.colors["fg"], anchor="w")
             lbl.pack(anchor="w", padx=8)
             self.top_labels.append(lbl)
+            self._labels.append(lbl)
         for lbl, txt in zip(self.top_labels, lines + [""]*(len(self.top_labels)-len(lines))):
-            lbl.config(text=txt)
+            self._set_text(lbl, txt)
 
     def _create_cpu_panel(self):
         f = tk.LabelFrame(self, text="CPU Usage", fg=self.colors["fg"], bg=self.colors["panel"])
         f.pack(fill="x", padx=8, pady=4)
+        self._labels.append(f)
 
         # total bar
-        self.total_canvas = tk.Canvas(f, height=18, bg=self.colors["bg"], highlightthickness=0)
+        self.total_canvas = self._create_bar(f, 18)
         self.total_canvas.pack(fill="x", padx=6, pady=3)
 
         # per-core
@@ -330,44 +477,62 @@ class SysMon(tk.Tk):
         n = psutil.cpu_count(logical=True)
         grid = tk.Frame(f, bg=self.colors["panel"])
         grid.pack(fill="x")
+        self._panels.append(grid)
         for i in range(n):
             r, c = divmod(i, cols)
             cell = tk.Frame(grid, bg=self.colors["panel"])
             cell.grid(row=r, column=c, sticky="ew", padx=4, pady=2)
             lbl = tk.Label(cell, text=f"CPU{i}", bg=self.colors["panel"], fg=self.colors["fg"], width=6, anchor="w")
             lbl.pack(side="left")
-            bar = tk.Canvas(cell, height=12, bg=self.colors["bg"], highlightthickness=0)
+            bar = self._create_bar(cell, 12)
             bar.pack(side="left", fill="x", expand=True, padx=4)
             pct = tk.Label(cell, text="0%", bg=self.colors["panel"], fg=self.colors["fg"], width=5, anchor="e")
             pct.pack(side="left")
             self.cpu_labels.append((lbl, bar, pct))
+            self._panels.append(cell)
+            self._labels += [lbl, pct]
 
     def _create_mem_swap_disk_panel(self):
         f = tk.LabelFrame(self, text="Memory / Swap / Disk", fg=self.colors["fg"], bg=self.colors["panel"])
         f.pack(fill="x", padx=8, pady=4)
+        self._labels.append(f)
 
         self.mem_label = tk.Label(f, bg=self.colors["panel"], fg=self.colors["fg"])
         self.mem_label.pack(fill="x", padx=8)
-        self.mem_canvas = tk.Canvas(f, height=16, bg=self.colors["bg"], highlightthickness=0)
+        self.mem_canvas = self._create_bar(f, 16)
         self.mem_canvas.pack(fill="x", padx=8)
 
         self.swap_label = tk.Label(f, bg=self.colors["panel"], fg=self.colors["fg"])
         self.swap_label.pack(fill="x", padx=8, pady=(6, 0))
-        self.swap_canvas = tk.Canvas(f, height=16, bg=self.colors["bg"], highlightthickness=0)
+        self.swap_canvas = self._create_bar(f, 16)
         self.swap_canvas.pack(fill="x", padx=8)
 
         self.disk_label = tk.Label(f, bg=self.colors["panel"], fg=self.colors["fg"])
         self.disk_label.pack(fill="x", padx=8, pady=(6, 0))
-        self.disk_canvas = tk.Canvas(f, height=16, bg=self.colors["bg"], highlightthickness=0)
+        self.disk_canvas = self._create_bar(f, 16)
         self.disk_canvas.pack(fill="x", padx=8)
+        self._labels += [self.mem_label, self.swap_label, self.disk_label]
 
     def _create_proc_table(self):
         f = tk.Frame(self, bg=self.colors["bg"])
         f.pack(fill="both", expand=True, padx=8, pady=4)
         cols = ("PID","USER","%CPU","%MEM","VIRT","RES","TIME","CMD")
 
+        ttk.Style().theme_use("default")
+        self._style_tree()
+
+        self.tree = ttk.Treeview(f, columns=cols, show="headings")
+        self._proc_rows = {}  # Treeview iid (str(pid)) -> values last shown
+        for c,w in zip(cols,[70,100,70,70,90,90,80,400]):
+            self.tree.column(c,width=w,anchor="w")
+            self.tree.heading(c,text=c,anchor="w")
+        vsb = ttk.Scrollbar(f, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        vsb.pack(side="right", fill="y")
+
+    def _style_tree(self):
         style = ttk.Style()
-        style.theme_use("default")
         style.configure("Treeview",
             background=self.colors["bg"],
             foreground=self.colors["fg"],
@@ -378,88 +543,256 @@ class SysMon(tk.Tk):
             background=[("selected", "#333333")],
             foreground=[("selected", self.colors["fg"])])
 
-        self.tree = ttk.Treeview(f, columns=cols, show="headings")
-        for c,w in zip(cols,[70,100,70,70,90,90,80,400]):
-            self.tree.column(c,width=w,anchor="w")
-            self.tree.heading(c,text=c,anchor="w")
-        vsb = ttk.Scrollbar(f, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
-        self.tree.pack(side="left", fill="both", expand=True)
-        vsb.pack(side="right", fill="y")
-
     def _create_statusbar(self):
         self.status = tk.Label(self, text="", anchor="w",
                                bg=self.colors["bg"], fg=self.colors["status"])
-        self.status._is_status = True
         self.status.pack(fill="x", side="bottom", padx=8, pady=4)
+        self._status_labels.append(self.status)
 
     # ---------- DRAW ----------
+    def _create_bar(self, parent, height):
+        """Canvas with persistent background/fill/text items, moved by _draw_bar."""
+        canvas = tk.Canvas(parent, height=height, bg=self.colors["bg"], highlightthickness=0)
+        canvas._bg_id = canvas.create_rectangle(0,0,0,0,outline="")
+        canvas._fill_id = canvas.create_rectangle(0,0,0,0,fill="",outline="")
+        canvas._text_id = canvas.create_text(0,0,text="")
+        # track the size here so _draw_bar needs no winfo_width/height calls
+        canvas._w, canvas._h = 100, height
+        canvas.bind("<Configure>", lambda e, c=canvas: (setattr(c, "_w", e.width), setattr(c, "_h", e.height)))
+        self._style_bar(canvas)
+        self._canvases.append(canvas)
+        return canvas
+
+    def _style_bar(self, canvas):
+        canvas.itemconfigure(canvas._bg_id, fill=self.colors["bg"])
+        canvas.itemconfigure(canvas._text_id, fill=self.colors["fg"],
+                             font=(FONT_BASE, max(7,self.font_size-2)))
+
+    def _set_text(self, lbl, txt):
+        """Configure a label's text only if it differs from what it shows."""
+        if getattr(lbl, "_last", None) != txt:
+            lbl.configure(text=txt)
+            lbl._last = txt
+
     def _draw_bar(self, canvas, pct, color):
-        canvas.delete("all")
-        w = canvas.winfo_width() or 100
-        h = canvas.winfo_height() or 14
-        canvas.create_rectangle(0,0,w,h,fill=self.colors["bg"],outline="")
-        canvas.create_rectangle(0,0,int(w*pct/100),h,fill=color,outline="")
-        canvas.create_text(w-25,h//2,text=f"{pct:.0f}%",fill=self.colors["fg"],
-                           font=(FONT_BASE, max(7,self.font_size-2)))
+        w, h = canvas._w, canvas._h
+        fill_w = int(w*pct/100)
+        txt = f"{pct:.0f}%"
+        state = (w, h, fill_w, txt, color)
+        if getattr(canvas, "_last", None) == state:
+            return
+        canvas._last = state
+        canvas.coords(canvas._bg_id, 0, 0, w, h)
+        canvas.coords(canvas._fill_id, 0, 0, fill_w, h)
+        canvas.itemconfigure(canvas._fill_id, fill=color)
+        canvas.coords(canvas._text_id, w-25, h//2)
+        canvas.itemconfigure(canvas._text_id, text=txt)
 
     # ---------- UPDATE LOOP ----------
     def _update_all(self):
+        if self._closing:
+            return
+        # skip this tick if the previous sample has not come back yet
+        if not self._sampling:
+            # process table is the costliest part, refresh it less often
+            with_procs = time.monotonic() - self._last_proc_update >= self._proc_interval_ms / 1000
+            if with_procs:
+                self._last_proc_update = time.monotonic()
+            self._sampling = True
+            asyncio.run_coroutine_threadsafe(self._sample(with_procs), self._loop)
+            self._start_drain()
+        self._schedule_next_tick()
+
+    def _schedule_next_tick(self):
+        """Schedule against a monotonic deadline so the period doesn't drift."""
+        now = time.monotonic()
+        interval = self.update_interval / 1000
+        self._next_tick += interval
+        if now > self._next_tick + interval:
+            # long stall (suspend, busy Tk): resync instead of catching up
+            self._next_tick = now + interval
+        delay = max(0, int((self._next_tick - now) * 1000))
+        self._after_id = self.after(delay, self._update_all)
+
+    async def _sample(self, with_procs):
+        """Collect one tick of readings off the Tk thread, then hand them to _apply_sample."""
+        snap = procs = None
+        try:
+            if with_procs:
+                snap, procs = await asyncio.gather(asyncio.to_thread(self._snapshot),
+                                                   asyncio.to_thread(self._collect_procs))
+            else:
+                snap = await asyncio.to_thread(self._snapshot)
+        except Exception as e:
+            print("Update error:", e, file=sys.stderr)
+        self._post(self._apply_sample, snap, procs)
+
+    def _post(self, fn, *args):
+        """Queue fn(*args) for the Tk thread; safe to call from the asyncio thread.
+
+        Results that arrive after shutdown are dropped.
+        """
+        if self._closing:
+            return
+        self._results.put((fn, args))
+
+    def _start_drain(self):
+        """Start polling for results, unless a poll is already scheduled."""
+        if self._poll_id is None:
+            self._poll_id = self.after(RESULT_POLL_MS, self._drain_results)
+
+    def _drain_results(self):
+        """Tk thread: run everything _post queued; keep polling while jobs are out."""
+        self._poll_id = None
+        if self._closing:
+            return
+        while True:
+            try:
+                fn, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                print("Update error:", e, file=sys.stderr)
+        if self._sampling or self._static_pending or not self._results.empty():
+            self._start_drain()
+
+    def _apply_sample(self, snap, procs):
+        self._sampling = False
+        if snap is None or self._closing:
+            return
         try:
-            self._update_cpu()
-            self._update_mem_swap_disk()
-            self._update_procs()
-            self._update_top_info()
+            self._update_cpu(snap)
+            self._update_mem_swap_disk(snap)
+            if procs is not None:
+                self._update_procs(snap, *procs)
+            self._update_top_info(snap)
         except Exception as e:
             print("Update error:", e, file=sys.stderr)
-        self.after(self.update_interval, self._update_all)
 
-    def _update_cpu(self):
-        total = psutil.cpu_percent(interval=None)
+    def _snapshot(self):
+        """System-wide readings for one tick, shared by all _update_* methods."""
+        if USE_PROC_FS:
+            cpu_total, *cpu_per = self._proc_cpu_percent()
+            vm = read_meminfo()
+        else:
+            cpu_total = psutil.cpu_percent(interval=None)
+            cpu_per = psutil.cpu_percent(percpu=True)
+            vm = psutil.virtual_memory()
+        return {
+            "cpu_total": cpu_total,
+            "cpu_per": cpu_per,
+            "vm": vm,
+            "sm": psutil.swap_memory(),
+            "disk": shutil.disk_usage("/"),
+            "host": self._static_info["host"],
+            "uptime": format_uptime(self._static_info["boot"]),
+        }
+
+    def _proc_cpu_percent(self):
+        """Busy % since the previous call, aggregate first, then per core."""
+        ticks = read_cpu_ticks()
+        prev = self._prev_cpu_ticks or ticks
+        self._prev_cpu_ticks = ticks
+        out = []
+        for (idle, total), (p_idle, p_total) in zip(ticks, prev):
+            dtotal = total - p_total
+            out.append(100 * (1 - (idle - p_idle) / dtotal) if dtotal > 0 else 0.0)
+        return out
+
+    def _update_cpu(self, snap):
+        total = snap["cpu_total"]
         self._draw_bar(self.total_canvas, total, color_for_load(total, self.colors))
-        per = psutil.cpu_percent(percpu=True)
+        per = snap["cpu_per"]
         for (lbl, bar, pct), p in zip(self.cpu_labels, per):
-            pct.config(text=f"{p:.0f}%")
+            self._set_text(pct, f"{p:.0f}%")
             self._draw_bar(bar, p, color_for_load(p, self.colors))
 
-    def _update_mem_swap_disk(self):
-        m = psutil.virtual_memory()
-        s = psutil.swap_memory()
-        d = shutil.disk_usage("/")
-        self.mem_label.config(text=f"RAM: {bytes2human(m.used)}/{bytes2human(m.total)} ({m.percent:.1f}%)")
-        self.swap_label.config(text=f"SWAP: {bytes2human(s.used)}/{bytes2human(s.total)} ({s.percent:.1f}%)")
+    def _update_mem_swap_disk(self, snap):
+        m = snap["vm"]
+        s = snap["sm"]
+        d = snap["disk"]
+        self._set_text(self.mem_label, f"RAM: {bytes2human(m.used)}/{bytes2human(m.total)} ({m.percent:.1f}%)")
+        self._set_text(self.swap_label, f"SWAP: {bytes2human(s.used)}/{bytes2human(s.total)} ({s.percent:.1f}%)")
         pct = (d.used/d.total)*100 if d.total else 0.0
-        self.disk_label.config(text=f"Disk /: {bytes2human(d.used)}/{bytes2human(d.total)} ({pct:.1f}%)")
+        self._set_text(self.disk_label, f"Disk /: {bytes2human(d.used)}/{bytes2human(d.total)} ({pct:.1f}%)")
         self._draw_bar(self.mem_canvas, m.percent, color_for_load(m.percent, self.colors))
         self._draw_bar(self.swap_canvas, s.percent, self.colors["swap"])
         self._draw_bar(self.disk_canvas, pct, self.colors["disk"])
 
-    def _update_procs(self):
-        self.tree.delete(*self.tree.get_children())
-        rows = []
-        for p in psutil.process_iter(["pid","username","cpu_percent","memory_percent","memory_info","cmdline","create_time"]):
+    def _iter_procs(self):
+        """Raw (pid, user, cpu, mem, mem_info, create_time, cmd) per process."""
+        for p in psutil.process_iter():
             try:
-                i = p.info
-                cmd = " ".join(i["cmdline"] or [p.name()])
-                if len(cmd) > 100: cmd = cmd[:97] + "..."
-                rows.append((
-                    i["pid"],
-                    i["username"] or "",
-                    f"{i['cpu_percent']:.1f}",
-                    f"{i['memory_percent']:.1f}",
-                    bytes2human(i["memory_info"].vms),
-                    bytes2human(i["memory_info"].rss),
-                    time.strftime("%H:%M:%S", time.localtime(i["create_time"])),
-                    cmd
-                ))
+                # oneshot() reads /proc/<pid>/stat & co. once for all fields below
+                with p.oneshot():
+                    pid = p.pid
+                    # denied user/cmdline get a fallback instead of hiding the process
+                    try: user = p.username()
+                    except psutil.AccessDenied: user = ""
+                    cpu = p.cpu_percent()
+                    mem = p.memory_percent()
+                    mi = p.memory_info()
+                    try: cmdline = p.cmdline()
+                    except psutil.AccessDenied: cmdline = None
+                    cmd = short_join(cmdline or [p.name()])
+                    ct = p.create_time()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
-        rows.sort(key=lambda r: float(r[2]), reverse=True)
-        for r in rows[:80]:
-            self.tree.insert("", "end", values=r)
-        self.status.config(text=f"Host: {socket.gethostname()} | Uptime: {format_uptime()} | "
-                                f"Processes: {len(rows)} | Interval: {self.update_interval/1000:.1f}s | "
-                                f"CPU: {psutil.cpu_percent():.1f}%")
+            yield pid, user, cpu, mem, mi, ct, cmd
+
+    def _collect_procs(self):
+        """Top 80 rows by %CPU plus the process count. Runs off the Tk thread."""
+        count = 0
+        def counted():
+            nonlocal count
+            for r in self._iter_procs():
+                count += 1
+                yield r
+        # nlargest streams the processes: no full list, no full sort
+        top = heapq.nlargest(80, counted(), key=lambda r: r[2])
+        rows = []
+        for pid, user, cpu, mem, mi, ct, cmd in top:
+            rows.append((
+                pid,
+                user or "",
+                f"{cpu:.1f}",
+                f"{mem:.1f}",
+                bytes2human(mi.vms),
+                bytes2human(mi.rss),
+                time.strftime("%H:%M:%S", time.localtime(ct)),
+                cmd
+            ))
+        return rows, count
+
+    def _update_procs(self, snap, rows, count):
+        self._sync_proc_tree(rows)
+        self._set_text(self.status, f"Host: {snap['host']} | Uptime: {snap['uptime']} | "
+                                    f"Processes: {count} | Interval: {self.update_interval/1000:.1f}s | "
+                                    f"CPU: {snap['cpu_total']:.1f}%")
+
+    def _sync_proc_tree(self, top):
+        """Update the Treeview in place: only touch rows that changed."""
+        order = []
+        for r in top:
+            iid = str(r[0])
+            order.append(iid)
+            old = self._proc_rows.get(iid)
+            if old is None:
+                self.tree.insert("", "end", iid=iid, values=r)
+            elif old != r:
+                self.tree.item(iid, values=r)
+            self._proc_rows[iid] = r
+        keep = set(order)
+        gone = [iid for iid in self._proc_rows if iid not in keep]
+        if gone:
+            self.tree.delete(*gone)
+            for iid in gone:
+                del self._proc_rows[iid]
+        if self.tree.get_children() != tuple(order):
+            for idx, iid in enumerate(order):
+                self.tree.move(iid, "", idx)
 
 # ---------- MAIN ----------
 if __name__ == "__main__":